@@ -0,0 +1,27 @@
+"""added kept to raid user reaction
+
+Revision ID: 5e2b9c8d4f17
+Revises: c3a7e1d05b42
+Create Date: 2026-10-19 14:03:52.117604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2b9c8d4f17'
+down_revision = 'c3a7e1d05b42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'RAID_USER_REACTION',
+        sa.Column('kept', sa.Boolean(), nullable=False, server_default=sa.text('0'))
+    )
+
+
+def downgrade():
+    op.drop_column('RAID_USER_REACTION', 'kept')
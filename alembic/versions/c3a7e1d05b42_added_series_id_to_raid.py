@@ -0,0 +1,26 @@
+"""added series_id to raid
+
+Revision ID: c3a7e1d05b42
+Revises: 9178fac93830
+Create Date: 2026-10-19 10:12:31.482913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3a7e1d05b42'
+down_revision = '9178fac93830'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('RAID', sa.Column('series_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_RAID_series_id'), 'RAID', ['series_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_RAID_series_id'), table_name='RAID')
+    op.drop_column('RAID', 'series_id')
@@ -1,3 +1,25 @@
+from disco.api.http import APIException
+
+UNKNOWN_MESSAGE_ERROR_CODE = 10008
+
+
 class Calendar:
     def __init__(self, channel):
         self.channel = channel
+
+    def send_message(self, embed):
+        return self.channel.send_message(embed=embed)
+
+    def edit_message(self, message_id, embed):
+        try:
+            return self.channel.client.api.channels_messages_modify(
+                self.channel.id, message_id, content=" ", embed=embed
+            )
+        except APIException as e:
+            if e.code != UNKNOWN_MESSAGE_ERROR_CODE:
+                raise e
+            return None
+
+    def delete_messages(self, message_ids):
+        if message_ids:
+            self.channel.delete_messages(message_ids)
@@ -10,3 +10,4 @@ class Raid(Base):
     date = Column(DateTime, unique=True)
     message_id = Column(String(32))
     color = Column(Integer)
+    series_id = Column(Integer, index=True)
@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import Integer, Column, String, Enum, DateTime
+from sqlalchemy import Integer, Column, String, Enum, DateTime, Boolean
 
 from plugins.raid.db import Base
 
@@ -29,6 +29,7 @@ class RaidUserReaction(Base):
     at = Column(DateTime, primary_key=True)
     reaction = Column(String(32))
     reason = Column(String(1000))
+    kept = Column(Boolean, nullable=False, default=False, server_default="0")
 
 
 reaction_to_icon = {
@@ -37,3 +38,17 @@ reaction_to_icon = {
     ReactionEnum.declined: "-",
     ReactionEnum.nothing: " "
 }
+
+
+emoji_to_reaction = {
+    "👍": (ReactionEnum.accepted, None),
+    "👎": (ReactionEnum.declined, None),
+    "🕧": (ReactionEnum.delayed, "+30m"),
+    "🕐": (ReactionEnum.delayed, "+1h"),
+    "🕜": (ReactionEnum.delayed, "+1h30m"),
+    "🕑": (ReactionEnum.delayed, "+2h"),
+    "🕝": (ReactionEnum.delayed, "+2h30m"),
+    "🕒": (ReactionEnum.delayed, "+3h"),
+    "🕞": (ReactionEnum.delayed, "+3h30m"),
+    "🕓": (ReactionEnum.delayed, "+4h"),
+}
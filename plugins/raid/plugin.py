@@ -1,4 +1,3 @@
-import functools
 import itertools
 from contextlib import contextmanager
 from datetime import datetime, date, timedelta
@@ -8,20 +7,24 @@ import dateutil.tz
 import dateutil.utils
 from colour import Color
 from dateutil import rrule
+from disco.api.http import APIException
 from disco.bot import Plugin, Config
-from disco.gateway.events import MessageReactionAdd, MessageCreate
+from disco.gateway.events import MessageReactionAdd, MessageReactionRemove, MessageCreate, GuildCreate, \
+    GuildMemberAdd, GuildMemberUpdate, GuildMemberRemove
 from disco.types import Guild, GuildMember
-from disco.util.snowflake import to_snowflake
-from sqlalchemy import create_engine, exists
+from disco.util.snowflake import to_snowflake, to_datetime
+from sqlalchemy import create_engine, exists, func
 from sqlalchemy.orm import sessionmaker
 
 from plugins.raid.calendar import Calendar
 from plugins.raid.classes import ClassEnum
 from plugins.raid.db.raid import Raid
-from plugins.raid.db.raid_user_reaction import RaidUserReaction, ReactionEnum
+from plugins.raid.db.raid_user_reaction import RaidUserReaction, ReactionEnum, emoji_to_reaction
 from plugins.raid.render.renderer import Renderer
 from plugins.raid.roles import RoleEnum
 
+UNKNOWN_MEMBER_ERROR_CODE = 10007
+
 
 class RaidPluginConfig(Config):
     db_connect_str = "sqlite:///raid.db"
@@ -30,6 +33,8 @@ class RaidPluginConfig(Config):
     locale = None
     timezone = "Europe/Berlin"
     calendar = {}
+    keep_reactions = False
+    raider_cache = False
 
 
 @Plugin.with_config(RaidPluginConfig)
@@ -44,12 +49,22 @@ class RaidPlugin(Plugin):
 
         self.timezone = dateutil.tz.gettz(self.config.timezone)
 
+        if self.config.raider_cache and self.bot.client.state.config.sync_guild_members:
+            self.log.warning(
+                "raider_cache is enabled but the client state still syncs all guild members; "
+                "set \"sync_guild_members\": false in the \"state\" config to save memory"
+            )
+
         self.renderer = Renderer(self.timezone)
         self.bot_channel_id = to_snowflake(self.config.bot_channel_id)
         self.raid_channel_id = to_snowflake(self.config.raid_channel_id)
         self.bot_channel = None
         self.calendar_channel = None
         self.calendar = None
+        self.raid_guild = None
+        self.members = {}
+        self.reactions = {}
+        self.reactions_synced = False
 
         engine = create_engine(self.config.db_connect_str)
         session_maker = sessionmaker()
@@ -61,9 +76,32 @@ class RaidPlugin(Plugin):
         self.bot_channel = self.bot.client.api.channels_get(self.config.bot_channel_id)
         self.calendar_channel = self.bot.client.api.channels_get(self.config.raid_channel_id)
         self.calendar = Calendar(self.calendar_channel)
+        self.reactions_synced = False
         self.register_schedule(self.cleanup, interval=60, repeat=True, init=True)
         self.register_schedule(self.remove_passed_raids, interval=60, repeat=True, init=True)
 
+    @Plugin.listen("GuildCreate")
+    def on_guild_create(self, event: GuildCreate):
+        if self.config.raider_cache and self.raid_channel_id in event.guild.channels:
+            first_guild_create = self.raid_guild is None
+            self.raid_guild = event.guild
+            if first_guild_create:
+                self.spawn(self._load_raiders, event.guild)
+
+    @Plugin.listen("GuildMemberAdd")
+    def on_guild_member_add(self, event: GuildMemberAdd):
+        self._on_guild_member_changed(event.member)
+
+    @Plugin.listen("GuildMemberUpdate")
+    def on_guild_member_update(self, event: GuildMemberUpdate):
+        self._on_guild_member_changed(event.member)
+
+    @Plugin.listen("GuildMemberRemove")
+    def on_guild_member_remove(self, event: GuildMemberRemove):
+        if self.config.raider_cache and self.raid_guild and event.guild_id == self.raid_guild.id:
+            if event.user.id in self.members:
+                self.members[event.user.id] = None
+
     def unload(self, ctx):
         super().unload(ctx)
         self.session.commit()
@@ -75,12 +113,6 @@ class RaidPlugin(Plugin):
     @Plugin.parser.add_argument("--freq", type=str)
     @Plugin.parser.add_argument("--count", type=int, default=1)
     def on_create_command(self, event, args):
-        def get_tz(tzname, tzoffset):
-            if tzname:
-                return dateutil.tz.gettz(tzname)
-            else:
-                return tzoffset
-
         if event.msg.channel.id != self.bot_channel.id:
             return
 
@@ -91,10 +123,7 @@ class RaidPlugin(Plugin):
             )
             return
 
-        at = dateutil.parser.parse(args.at, tzinfos=get_tz)
-        at = dateutil.utils.default_tzinfo(at, self.timezone)
-        at = at.astimezone(dateutil.tz.UTC)
-        at = at.replace(tzinfo=None)
+        at = self._parse_datetime(args.at)
 
         if args.freq:
             freq_map = {
@@ -103,28 +132,52 @@ class RaidPlugin(Plugin):
                 "daily": rrule.DAILY
             }
             occurrences = rrule.rrule(freq=freq_map[args.freq], count=args.count, dtstart=at)
+            series_id = self._next_series_id()
         else:
             occurrences = (at,)
+            series_id = None
 
         for occurrence in occurrences:
-            self._create_raid(occurrence, int(args.color.hex_l[1:], 16))
+            self._create_raid(occurrence, int(args.color.hex_l[1:], 16), series_id)
 
     @Plugin.command("delete", parser=True)
     @Plugin.parser.add_argument("-h", "--help", action="store_true")
     @Plugin.parser.add_argument("raid_ids", type=int, nargs="*")
+    @Plugin.parser.add_argument("--from", dest="from_", type=str)
+    @Plugin.parser.add_argument("--to", type=str)
+    @Plugin.parser.add_argument("--color", type=Color)
+    @Plugin.parser.add_argument("--series", type=int)
     def on_delete_command(self, event, args):
         if event.msg.channel.id != self.bot_channel.id:
             return
 
-        if args.help or not args.raid_ids:
+        has_filter = args.raid_ids or args.from_ or args.to or args.color or args.series is not None
+        if args.help or not has_filter:
             event.msg.reply(
                 "**Delete one or more raids.**\n\n"
-                "Usage: `!delete <raid_id> [<raid_id>...]`"
+                "Usage: `!delete [<raid_id>...] [--from <datetime>] [--to <datetime>] "
+                "[--color <color>] [--series <series_id>]`\n"
+                "All given filters must match for a raid to be deleted. "
+                "A `--to` date without a time includes the whole day."
             )
             return
 
-        for raid_id in args.raid_ids:
-            self._delete_raid(raid_id)
+        query = self.session.query(Raid)
+        if args.raid_ids:
+            query = query.filter(Raid.id.in_(args.raid_ids))
+        if args.from_:
+            query = query.filter(Raid.date >= self._parse_datetime(args.from_))
+        if args.to:
+            if self._is_date_only(args.to):
+                query = query.filter(Raid.date < self._parse_datetime(args.to, days=1))
+            else:
+                query = query.filter(Raid.date <= self._parse_datetime(args.to))
+        if args.color:
+            query = query.filter(Raid.color == int(args.color.hex_l[1:], 16))
+        if args.series is not None:
+            query = query.filter(Raid.series_id == args.series)
+
+        self._delete_raids(query)
 
     @Plugin.listen("MessageCreate")
     def on_message_create(self, event: MessageCreate):
@@ -138,7 +191,25 @@ class RaidPlugin(Plugin):
         if event.channel_id == self.calendar_channel.id:
             if event.user_id != self.bot.client.state.me.id:
                 self._on_raid_channel_reaction(event.message_id, event.user_id, datetime.utcnow(), event.emoji)
-                event.delete()
+                if self.config.keep_reactions:
+                    self._track_reaction(event.message_id, event.user_id, event.emoji)
+                else:
+                    event.delete()
+
+    @Plugin.listen("MessageReactionRemove")
+    def on_message_reaction_remove(self, event: MessageReactionRemove):
+        if not self.config.keep_reactions:
+            return
+        if event.channel_id == self.calendar_channel.id:
+            if event.user_id != self.bot.client.state.me.id:
+                self._on_raid_channel_reaction_removed(event.message_id, event.user_id, datetime.utcnow(), event.emoji)
+
+    @Plugin.listen("MessageReactionRemoveAll")
+    def on_message_reaction_remove_all(self, event):
+        if not self.config.keep_reactions:
+            return
+        if event.channel_id == self.calendar_channel.id:
+            self._on_raid_channel_reactions_cleared(event.message_id, datetime.utcnow())
 
     @staticmethod
     @contextmanager
@@ -150,6 +221,27 @@ class RaidPlugin(Plugin):
             session.rollback()
             raise e
 
+    @staticmethod
+    def _get_tz(tzname, tzoffset):
+        if tzname:
+            return dateutil.tz.gettz(tzname)
+        else:
+            return tzoffset
+
+    @classmethod
+    def _is_date_only(cls, value):
+        midnight = datetime.combine(date.today(), datetime.min.time())
+        at_midnight = dateutil.parser.parse(value, default=midnight, tzinfos=cls._get_tz)
+        at_noon = dateutil.parser.parse(value, default=midnight.replace(hour=12), tzinfos=cls._get_tz)
+        return at_midnight.hour != at_noon.hour
+
+    def _parse_datetime(self, value, days=0):
+        at = dateutil.parser.parse(value, tzinfos=self._get_tz)
+        at = dateutil.utils.default_tzinfo(at, self.timezone)
+        at = at + timedelta(days=days)
+        at = at.astimezone(dateutil.tz.UTC)
+        return at.replace(tzinfo=None)
+
     def format_datetime(self, dt):
         return dt\
             .replace(tzinfo=dateutil.tz.UTC)\
@@ -167,7 +259,16 @@ class RaidPlugin(Plugin):
                     else:
                         raid_messages.append(message)
                 if len(unwanted_messages) > 0:
-                    self.calendar_channel.delete_messages(unwanted_messages)
+                    self.calendar.delete_messages([message.id for message in unwanted_messages])
+            if self.config.keep_reactions:
+                if not self.reactions_synced:
+                    for raid_message in raid_messages:
+                        self._sync_raid_reactions(raid_message)
+                    self.reactions_synced = True
+                raid_message_ids = {raid_message.id for raid_message in raid_messages}
+                for message_id in set(self.reactions) - raid_message_ids:
+                    del self.reactions[message_id]
+                return
             for raid_message in raid_messages:
                 for reaction in raid_message.reactions:
                     if reaction.emoji.name == "🤖":
@@ -185,33 +286,106 @@ class RaidPlugin(Plugin):
                     Raid.message_id != None
                 ) \
                 .all()
-            self.calendar_channel.delete_messages([raid.message_id for raid in raids_to_remove])
+            self.calendar.delete_messages([raid.message_id for raid in raids_to_remove])
             for raid in raids_to_remove:
                 self.bot_channel.send_message("Raid removed from calendar: {}".format(self.format_datetime(raid.date)))
                 raid.message_id = None
 
     def _on_raid_channel_reaction(self, message_id, user_id, at, emoji):
-        emoji_to_method = {
-            "👍": functools.partial(self._set_raid_invite_reaction, reaction=ReactionEnum.accepted),
-            "👎": functools.partial(self._set_raid_invite_reaction, reaction=ReactionEnum.declined),
-            "🕧": functools.partial(self._set_raid_invite_reaction, reaction=ReactionEnum.delayed, reason="+30m"),
-            "🕐": functools.partial(self._set_raid_invite_reaction, reaction=ReactionEnum.delayed, reason="+1h"),
-            "🕜": functools.partial(self._set_raid_invite_reaction, reaction=ReactionEnum.delayed, reason="+1h30m"),
-            "🕑": functools.partial(self._set_raid_invite_reaction, reaction=ReactionEnum.delayed, reason="+2h"),
-            "🕝": functools.partial(self._set_raid_invite_reaction, reaction=ReactionEnum.delayed, reason="+2h30m"),
-            "🕒": functools.partial(self._set_raid_invite_reaction, reaction=ReactionEnum.delayed, reason="+3h"),
-            "🕞": functools.partial(self._set_raid_invite_reaction, reaction=ReactionEnum.delayed, reason="+3h30m"),
-            "🕓": functools.partial(self._set_raid_invite_reaction, reaction=ReactionEnum.delayed, reason="+4h"),
-        }
+        with self._transaction(self.session):
+            raid = self._expect_raid_by_message_id(message_id)
+
+            if emoji.name in emoji_to_reaction:
+                reaction, reason = emoji_to_reaction[emoji.name]
+                self._set_raid_invite_reaction(
+                    raid=raid, user_id=user_id, at=at, reaction=reaction, reason=reason,
+                    kept=self.config.keep_reactions
+                )
+                self._update_calendar_message(raid)
+
+    def _on_raid_channel_reaction_removed(self, message_id, user_id, at, emoji):
+        reacted_emojis = self.reactions.get(message_id, {}).get(user_id, [])
+        if emoji.name in reacted_emojis:
+            reacted_emojis.remove(emoji.name)
 
         with self._transaction(self.session):
             raid = self._expect_raid_by_message_id(message_id)
 
-            if emoji.name in emoji_to_method:
-                emoji_to_method[emoji.name](raid=raid, user_id=user_id, at=at)
+            if emoji.name in emoji_to_reaction:
+                current = self._get_latest_reactions_by_raid_id(raid.id).get(to_snowflake(user_id))
+                if current and self._reaction_state(current) == emoji_to_reaction[emoji.name]:
+                    if reacted_emojis:
+                        reaction, reason = emoji_to_reaction[reacted_emojis[-1]]
+                    else:
+                        reaction, reason = ReactionEnum.nothing, None
+                    self._set_raid_invite_reaction(
+                        raid=raid, user_id=user_id, at=at, reaction=reaction, reason=reason, kept=True
+                    )
+                    self._update_calendar_message(raid)
+
+    def _on_raid_channel_reactions_cleared(self, message_id, at):
+        self.reactions.pop(message_id, None)
+
+        with self._transaction(self.session):
+            raid = self._expect_raid_by_message_id(message_id)
+            if self._reset_missing_reactions(raid, message_id, (), at):
                 self._update_calendar_message(raid)
 
-    def _create_raid(self, at, color):
+    def _track_reaction(self, message_id, user_id, emoji):
+        if emoji.name in emoji_to_reaction:
+            reacted_emojis = self.reactions.setdefault(message_id, {}).setdefault(user_id, [])
+            if emoji.name not in reacted_emojis:
+                reacted_emojis.append(emoji.name)
+
+    def _sync_raid_reactions(self, raid_message):
+        raid = self._expect_raid_by_message_id(raid_message.id)
+
+        reacted_emojis = {}
+        for reaction in raid_message.reactions:
+            if reaction.emoji.name not in emoji_to_reaction:
+                continue
+            if reaction.count <= (1 if reaction.me else 0):
+                continue
+            for reactor in raid_message.get_reactors(reaction.emoji):
+                if reactor.id != self.bot.client.state.me.id:
+                    reacted_emojis.setdefault(reactor.id, []).append(reaction.emoji.name)
+        self.reactions[raid_message.id] = reacted_emojis
+
+        at = datetime.utcnow()
+        latest_reactions = self._get_latest_reactions_by_raid_id(raid.id)
+        changed = False
+        for user_id, emojis in reacted_emojis.items():
+            states = [emoji_to_reaction[emoji] for emoji in emojis]
+            current = latest_reactions.get(user_id)
+            if current is None or self._reaction_state(current) not in states:
+                reaction, reason = states[-1]
+                self._set_raid_invite_reaction(
+                    raid=raid, user_id=user_id, at=at, reaction=reaction, reason=reason, kept=True
+                )
+                changed = True
+            elif not current.kept:
+                current.kept = True
+
+        if self._reset_missing_reactions(raid, raid_message.id, reacted_emojis, at):
+            changed = True
+
+        if changed:
+            self._update_calendar_message(raid)
+
+    def _reset_missing_reactions(self, raid, message_id, present_user_ids, at):
+        # Only states backed by a reaction kept on this very message can go missing from it.
+        posted_at = to_datetime(message_id)
+        changed = False
+        for user_id, current in self._get_latest_reactions_by_raid_id(raid.id).items():
+            if user_id in present_user_ids or not current.kept or current.at < posted_at:
+                continue
+            if ReactionEnum(current.reaction) == ReactionEnum.nothing:
+                continue
+            self._set_raid_invite_reaction(raid=raid, user_id=user_id, at=at, reaction=ReactionEnum.nothing)
+            changed = True
+        return changed
+
+    def _create_raid(self, at, color, series_id=None):
         with self._transaction(self.session):
             if at < datetime.utcnow():
                 self.bot_channel.send_message("Can't create raids in the past.")
@@ -221,20 +395,43 @@ class RaidPlugin(Plugin):
                 self.bot_channel.send_message("Raid already exists.")
                 return
 
-            raid = Raid(date=at, color=color)
+            raid = Raid(date=at, color=color, series_id=series_id)
             self.session.add(raid)
             self._add_raid_to_calendar(raid)
             self.bot_channel.send_message("Raid created: {}.".format(self.format_datetime(at)))
 
-    def _delete_raid(self, raid_id):
+    def _delete_raids(self, query):
         with self._transaction(self.session):
-            raid = self.session.query(Raid).filter_by(id=raid_id).one_or_none()
-            if raid:
-                self._delete_calendar_message(raid)
-                self.session.delete(raid)
-                self.bot_channel.send_message("Raid deleted: {}.".format(self.format_datetime(raid.date)))
-            else:
-                self.bot_channel.send_message("Raid not found.")
+            raids = query.order_by(Raid.date).all()
+            if not raids:
+                self.bot_channel.send_message("No matching raids found.")
+                return
+
+            message_ids = [raid.message_id for raid in raids if raid.message_id]
+            dates = [self.format_datetime(raid.date) for raid in raids]
+
+            self.session \
+                .query(Raid) \
+                .filter(Raid.id.in_([raid.id for raid in raids])) \
+                .delete(synchronize_session=False)
+
+        self.calendar.delete_messages(message_ids)
+        self.bot_channel.send_message(self._format_summary("Raids deleted ({}):".format(len(dates)), dates))
+
+    @staticmethod
+    def _format_summary(title, lines, max_length=2000):
+        summary = title
+        for i, line in enumerate(lines):
+            more = "\n... and {} more".format(len(lines) - i)
+            reserved = len(more) if i < len(lines) - 1 else 0
+            if len(summary) + 1 + len(line) + reserved > max_length:
+                return summary + more
+            summary += "\n" + line
+        return summary
+
+    def _next_series_id(self):
+        max_series_id = self.session.query(func.max(Raid.series_id)).scalar()
+        return (max_series_id or 0) + 1
 
     def _add_raid_to_calendar(self, raid):
         if raid.date.date() > date.today() + timedelta(days=14):
@@ -251,55 +448,105 @@ class RaidPlugin(Plugin):
             .all()
 
         if raids_to_reorder:
-            self.calendar_channel.delete_messages([r.message_id for r in raids_to_reorder])
+            self.calendar.delete_messages([r.message_id for r in raids_to_reorder])
 
             for raid in raids_to_reorder:
                 raid.message_id = self._create_calendar_message(raid).id
 
     def _create_calendar_message(self, raid):
         roster = self._get_roster_by_raid_and_guild(raid, self.calendar_channel.guild)
-        return self.calendar_channel.send_message(embed=self.renderer.render_raid(raid, roster))
+        return self.calendar.send_message(self.renderer.render_raid(raid, roster))
 
     def _update_calendar_message(self, raid):
         if raid.message_id:
             roster = self._get_roster_by_raid_and_guild(raid, self.calendar_channel.guild)
-            raid_msg = self.calendar_channel.get_message(raid.message_id)
-            raid_msg.edit(content=" ", embed=self.renderer.render_raid(raid, roster))
-
-    def _delete_calendar_message(self, raid):
-        if raid.message_id:
-            self.calendar_channel.get_message(raid.message_id).delete()
+            if not self.calendar.edit_message(raid.message_id, self.renderer.render_raid(raid, roster)):
+                raid.message_id = None
+                self._add_raid_to_calendar(raid)
 
-    def _set_raid_invite_reaction(self, raid, user_id, at, reaction, reason=None):
+    def _set_raid_invite_reaction(self, raid, user_id, at, reaction, reason=None, kept=False):
         user_reaction = RaidUserReaction(
             raid_id=raid.id,
             user_id=user_id,
             at=at,
             reaction=reaction.value,
-            reason=reason
+            reason=reason,
+            kept=kept
         )
         self.session.add(user_reaction)
 
+    def _on_guild_member_changed(self, member: GuildMember):
+        if self.config.raider_cache and self.raid_guild and member.guild_id == self.raid_guild.id:
+            if self._is_raider(member, self.raid_guild) or member.id in self.members:
+                self.members[member.id] = self._to_member_record(member, self.raid_guild)
+
+    def _load_raiders(self, guild: Guild):
+        members = {}
+        after = None
+        while True:
+            batch = self.bot.client.api.guilds_members_list(guild.id, limit=1000, after=after)
+            for member in batch.values():
+                if self._is_raider(member, guild):
+                    members[member.id] = self._to_member_record(member, guild)
+            if len(batch) < 1000:
+                break
+            after = max(batch.keys())
+        # Keep records that member events or on-demand lookups stored while loading.
+        members.update(self.members)
+        self.members = members
+
+    def _get_member_record(self, guild: Guild, user_id):
+        if not self.config.raider_cache:
+            member = guild.members.get(user_id)
+            return self._to_member_record(member, guild) if member else None
+
+        if user_id not in self.members:
+            try:
+                member = self.bot.client.api.guilds_members_get(guild.id, user_id)
+            except APIException as e:
+                if e.code != UNKNOWN_MEMBER_ERROR_CODE:
+                    raise e
+                member = None
+            self.members[user_id] = self._to_member_record(member, guild) if member else None
+        return self.members[user_id]
+
+    def _get_raider_records(self, guild: Guild):
+        if self.config.raider_cache:
+            return [record for record in self.members.values() if record and record["raider"]]
+        return [
+            self._to_member_record(member, guild)
+            for member in guild.members.values()
+            if self._is_raider(member, guild)
+        ]
+
+    def _to_member_record(self, member: GuildMember, guild: Guild):
+        return {
+            "id": member.id,
+            "name": member.name,
+            "class": self._get_class(member, guild),
+            "role": self._get_role(member, guild),
+            "raider": self._is_raider(member, guild)
+        }
+
     @staticmethod
-    def _is_raider(member: GuildMember):
-        guild = member.guild
+    def _is_raider(member: GuildMember, guild: Guild):
         for role_id in member.roles:
             if guild.roles[role_id].name in ("Mainraider", "Testraider"):
                 return True
         return False
 
     @staticmethod
-    def _get_class(member: GuildMember):
+    def _get_class(member: GuildMember, guild: Guild):
         for role_id in member.roles:
-            role_name = member.guild.roles[role_id].name
+            role_name = guild.roles[role_id].name
             if role_name in [class_.value for class_ in ClassEnum]:
                 return ClassEnum(role_name)
         return ClassEnum.unknown
 
     @staticmethod
-    def _get_role(member: GuildMember):
+    def _get_role(member: GuildMember, guild: Guild):
         for role_id in member.roles:
-            role_name = member.guild.roles[role_id].name
+            role_name = guild.roles[role_id].name
             if role_name in [role.value for role in RoleEnum]:
                 return RoleEnum(role_name)
         return RoleEnum.unknown
@@ -312,24 +559,23 @@ class RaidPlugin(Plugin):
     def _get_roster_by_raid_and_guild(self, raid, guild: Guild):
         roster = {}
 
-        for member in guild.members.values():
-            if self._is_raider(member):
-                roster[member.id] = {
-                    "name": member.name,
-                    "class": self._get_class(member),
-                    "role": self._get_role(member),
-                    "reaction": ReactionEnum.nothing
-                }
+        for record in self._get_raider_records(guild):
+            roster[record["id"]] = {
+                "name": record["name"],
+                "class": record["class"],
+                "role": record["role"],
+                "reaction": ReactionEnum.nothing
+            }
 
         reactions = self._get_all_reactions_by_raid_id(raid.id)
         for reaction in reactions:
-            member = guild.members.get(to_snowflake(reaction.user_id))
-            if member is None:
+            record = self._get_member_record(guild, to_snowflake(reaction.user_id))
+            if record is None:
                 continue
-            raider = roster.setdefault(member.id, {
-                "name": member.name,
-                "class": self._get_class(member),
-                "role": self._get_role(member)
+            raider = roster.setdefault(record["id"], {
+                "name": record["name"],
+                "class": record["class"],
+                "role": record["role"]
             })
             raider["reaction"] = ReactionEnum(reaction.reaction)
             raider["reaction_time"] = str(reaction.at)
@@ -340,6 +586,16 @@ class RaidPlugin(Plugin):
     def _expect_raid_by_message_id(self, message_id):
         return self.session.query(Raid).filter_by(message_id=message_id).one()
 
+    @staticmethod
+    def _reaction_state(user_reaction):
+        return ReactionEnum(user_reaction.reaction), user_reaction.reason
+
+    def _get_latest_reactions_by_raid_id(self, raid_id):
+        return {
+            to_snowflake(reaction.user_id): reaction
+            for reaction in self._get_all_reactions_by_raid_id(raid_id)
+        }
+
     def _get_all_reactions_by_raid_id(self, raid_id):
         return self.session \
             .query(RaidUserReaction) \
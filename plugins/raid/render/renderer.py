@@ -90,7 +90,7 @@ class Renderer:
         embed = MessageEmbed(
             title=at.astimezone(self.timezone).strftime("%A %H:%M - %x"),
             color=raid.color or 0,
-            description="Raid ID: {}".format(raid.id),
+            description=self.render_description(raid),
             thumbnail={
                 "url": weekday_to_url[raid.date.weekday()]
             }
@@ -103,6 +103,13 @@ class Renderer:
             embed.fields.remove(None)
         return embed
 
+    @staticmethod
+    def render_description(raid):
+        if raid.series_id is not None:
+            return "Raid ID: {} - Series: {}".format(raid.id, raid.series_id)
+        else:
+            return "Raid ID: {}".format(raid.id)
+
     @staticmethod
     def _count_if(iterable, condition):
         return sum(1 for _ in filter(condition, iterable))